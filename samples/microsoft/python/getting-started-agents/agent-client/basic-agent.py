@@ -59,10 +59,11 @@ with agents_client:
     # [START create_run]
     run = agents_client.runs.create(thread_id=thread.id, agent_id=agent.id)
 
-    # Poll the run as long as run status is queued or in progress
+    # Poll the run as long as run status is queued or in progress, backing off exponentially
+    poll_interval = 0.25
     while run.status in ["queued", "in_progress", "requires_action"]:
-        # Wait for a second
-        time.sleep(1)
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, 2.0)
         run = agents_client.runs.get(thread_id=thread.id, run_id=run.id)
         # [END create_run]
         print(f"Run status: {run.status}")
@@ -58,7 +58,7 @@ with AIProjectClient(
     # <agent_creation>
     # Create agent with code interpreter tool and tools_resources
     agent = project_client.agents.create_agent(
-        model=os.environ["MODEL_DEPLOYMENT_NAME"],
+        model=model_deployment_name,
         name="my-assistant",
         instructions="You are helpful assistant",
         tools=code_interpreter.definitions,
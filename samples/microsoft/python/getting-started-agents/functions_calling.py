@@ -22,6 +22,7 @@ USAGE:
 """
 # Import necessary modules
 import os, time
+from concurrent.futures import ThreadPoolExecutor
 from azure.identity import DefaultAzureCredential
 from azure.ai.projects import AIProjectClient  # Import AIProjectClient for consistency
 from azure.ai.agents.models import FunctionTool, RequiredFunctionToolCall, SubmitToolOutputsAction, ToolOutput
@@ -39,6 +40,23 @@ project_client = AIProjectClient(
 # Initialize the FunctionTool with user-defined functions
 functions = FunctionTool(functions=user_functions)
 
+
+def execute_tool_call(tool_call):
+    """Executes one function tool call, returning its ToolOutput or None if it failed."""
+    try:
+        # Execute the tool call and collect the output
+        print(f"Executing tool call: {tool_call}")
+        output = functions.execute(tool_call)
+        return ToolOutput(
+            tool_call_id=tool_call.id,  # ID of the tool call
+            output=output,  # Output of the tool call
+        )
+    except Exception as e:
+        # Log any errors encountered during tool execution
+        print(f"Error executing tool_call {tool_call.id}: {e}")
+        return None
+
+
 # Use the project client within a context manager to ensure proper resource cleanup
 with project_client:
     # Create an agent with custom functions
@@ -62,13 +80,15 @@ with project_client:
     )
     print(f"Created message, ID: {message['id']}")
 
-    # Create and process a run for the agent to handle the message
-    run = project_client.agents.runs.create_and_process(thread_id=thread.id, agent_id=agent.id)
+    # Create a run for the agent to handle the message; it is polled and its tool calls handled below
+    run = project_client.agents.runs.create(thread_id=thread.id, agent_id=agent.id)
     print(f"Created run, ID: {run.id}")
 
-    # Poll the run status until it is completed or requires action
+    # Poll the run status until it is completed or requires action, backing off exponentially
+    poll_interval = 0.25
     while run.status in ["queued", "in_progress", "requires_action"]:
-        time.sleep(1)  # Wait for 1 second before checking the status again
+        time.sleep(poll_interval)  # Wait before checking the status again
+        poll_interval = min(poll_interval * 2, 2.0)
         run = project_client.agents.runs.get(thread_id=thread.id, run_id=run.id)
 
         # Handle cases where the run requires action
@@ -80,22 +100,11 @@ with project_client:
                 project_client.agents.runs.cancel(thread_id=thread.id, run_id=run.id)
                 break
 
-            tool_outputs = []
-            for tool_call in tool_calls:
-                if isinstance(tool_call, RequiredFunctionToolCall):
-                    try:
-                        # Execute the tool call and collect the output
-                        print(f"Executing tool call: {tool_call}")
-                        output = functions.execute(tool_call)
-                        tool_outputs.append(
-                            ToolOutput(
-                                tool_call_id=tool_call.id,  # ID of the tool call
-                                output=output,  # Output of the tool call
-                            )
-                        )
-                    except Exception as e:
-                        # Log any errors encountered during tool execution
-                        print(f"Error executing tool_call {tool_call.id}: {e}")
+            # Execute the function calls concurrently, so the turn takes as long as the slowest call
+            function_calls = [tool_call for tool_call in tool_calls if isinstance(tool_call, RequiredFunctionToolCall)]
+            with ThreadPoolExecutor(max_workers=min(len(function_calls), 8) or 1) as executor:
+                results = list(executor.map(execute_tool_call, function_calls))
+            tool_outputs = [output for output in results if output is not None]
 
             print(f"Tool outputs: {tool_outputs}")
             if tool_outputs:
@@ -103,6 +112,7 @@ with project_client:
                 project_client.agents.runs.submit_tool_outputs(
                     thread_id=thread.id, run_id=run.id, tool_outputs=tool_outputs
                 )
+                poll_interval = 0.25  # The run resumes now, so check back soon
 
         print(f"Current run status: {run.status}")
 
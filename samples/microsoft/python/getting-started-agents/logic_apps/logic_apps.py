@@ -52,9 +52,12 @@ from user_logic_apps import AzureLogicAppTool, create_send_email_function
 # </imports>
 
 # <client_initialization>
+# Create one credential and share it with every client so tokens are acquired and cached once
+credential = DefaultAzureCredential()
+
 # Create the project client
 project_client = AIProjectClient(
-    credential=DefaultAzureCredential(),
+    credential=credential,
     endpoint=os.environ["PROJECT_ENDPOINT"],
 )
 # </client_initialization>
@@ -69,7 +72,7 @@ logic_app_name = "<LOGIC_APP_NAME>"
 trigger_name = "<TRIGGER_NAME>"
 
 # Create and initialize AzureLogicAppTool utility
-logic_app_tool = AzureLogicAppTool(subscription_id, resource_group)
+logic_app_tool = AzureLogicAppTool(subscription_id, resource_group, credential=credential)
 logic_app_tool.register_logic_app(logic_app_name, trigger_name)
 print(f"Registered logic app '{logic_app_name}' with trigger '{trigger_name}'.")
 # </logic_app_tool_setup>
@@ -132,4 +135,7 @@ with project_client:
     # Fetch and log all messages
     messages = project_client.agents.messages.list(thread_id=thread.id)
     print(f"Messages: {messages}")
+
+    # Close the Logic App tool's HTTP session
+    logic_app_tool.close()
     # </cleanup>
\ No newline at end of file
@@ -6,8 +6,47 @@
 
 import json
 import datetime
+import types
 from typing import Any, Callable, Set, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serializes a tool result to a JSON string, using orjson when it is installed.
+    Falls back to json for values orjson rejects (e.g. integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj)
+
+
+# Default format used by fetch_current_datetime when the caller does not pass one
+DEFAULT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Read-only mock data, built once at import instead of on every call
+MOCK_WEATHER_DATA = types.MappingProxyType(
+    {"New York": "Sunny, 25°C", "London": "Cloudy, 18°C", "Tokyo": "Rainy, 22°C"}
+)
+MOCK_USERS = types.MappingProxyType(
+    {
+        1: {"name": "Alice", "email": "alice@example.com"},
+        2: {"name": "Bob", "email": "bob@example.com"},
+        3: {"name": "Charlie", "email": "charlie@example.com"},
+    }
+)
+
+# Precomputed results for toggle_flag, which only ever returns one of these two strings
+TOGGLED_TRUE_JSON = '{"toggled_flag": true}'
+TOGGLED_FALSE_JSON = '{"toggled_flag": false}'
+
 # These are the user-defined functions that can be called by the agent.
 
 
@@ -21,13 +60,8 @@ def fetch_current_datetime(format: Optional[str] = None) -> str:
     """
     current_time = datetime.datetime.now()
 
-    # Use the provided format if available, else use a default format
-    if format:
-        time_format = format
-    else:
-        time_format = "%Y-%m-%d %H:%M:%S"
-
-    time_json = json.dumps({"current_time": current_time.strftime(time_format)})
+    # Use the provided format if available, else use the default format
+    time_json = _dumps({"current_time": current_time.strftime(format or DEFAULT_TIME_FORMAT)})
     return time_json
 
 
@@ -41,9 +75,8 @@ def fetch_weather(location: str) -> str:
     """
     # In a real-world scenario, you'd integrate with a weather API.
     # Here, we'll mock the response.
-    mock_weather_data = {"New York": "Sunny, 25°C", "London": "Cloudy, 18°C", "Tokyo": "Rainy, 22°C"}
-    weather = mock_weather_data.get(location, "Weather data not available for this location.")
-    weather_json = json.dumps({"weather": weather})
+    weather = MOCK_WEATHER_DATA.get(location, "Weather data not available for this location.")
+    weather_json = _dumps({"weather": weather})
     return weather_json
 
 
@@ -59,11 +92,9 @@ def send_email(recipient: str, subject: str, body: str) -> str:
     """
     # In a real-world scenario, you'd use an SMTP server or an email service API.
     # Here, we'll mock the email sending.
-    print(f"Sending email to {recipient}...")
-    print(f"Subject: {subject}")
-    print(f"Body:\n{body}")
+    print(f"Sending email to {recipient}...\nSubject: {subject}\nBody:\n{body}")
 
-    message_json = json.dumps({"message": f"Email successfully sent to {recipient}."})
+    message_json = _dumps({"message": f"Email successfully sent to {recipient}."})
     return message_json
 
 
@@ -79,11 +110,9 @@ def send_email_using_recipient_name(recipient: str, subject: str, body: str) ->
     """
     # In a real-world scenario, you'd use an SMTP server or an email service API.
     # Here, we'll mock the email sending.
-    print(f"Sending email to {recipient}...")
-    print(f"Subject: {subject}")
-    print(f"Body:\n{body}")
+    print(f"Sending email to {recipient}...\nSubject: {subject}\nBody:\n{body}")
 
-    message_json = json.dumps({"message": f"Email successfully sent to {recipient}."})
+    message_json = _dumps({"message": f"Email successfully sent to {recipient}."})
     return message_json
 
 
@@ -99,7 +128,7 @@ def calculate_sum(a: int, b: int) -> str:
     :rtype: str
     """
     result = a + b
-    return json.dumps({"result": result})
+    return _dumps({"result": result})
 
 
 def convert_temperature(celsius: float) -> str:
@@ -112,7 +141,7 @@ def convert_temperature(celsius: float) -> str:
     :rtype: str
     """
     fahrenheit = (celsius * 9 / 5) + 32
-    return json.dumps({"fahrenheit": fahrenheit})
+    return _dumps({"fahrenheit": fahrenheit})
 
 
 def toggle_flag(flag: bool) -> str:
@@ -124,8 +153,7 @@ def toggle_flag(flag: bool) -> str:
     :return: The toggled flag.
     :rtype: str
     """
-    toggled = not flag
-    return json.dumps({"toggled_flag": toggled})
+    return TOGGLED_FALSE_JSON if flag else TOGGLED_TRUE_JSON
 
 
 def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> str:
@@ -139,9 +167,8 @@ def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> str:
     :return: The merged dictionary.
     :rtype: str
     """
-    merged = dict1.copy()
-    merged.update(dict2)
-    return json.dumps({"merged_dict": merged})
+    merged = dict1 | dict2
+    return _dumps({"merged_dict": merged})
 
 
 def get_user_info(user_id: int) -> str:
@@ -153,13 +180,8 @@ def get_user_info(user_id: int) -> str:
     :return: User information as a JSON string.
     :rtype: str
     """
-    mock_users = {
-        1: {"name": "Alice", "email": "alice@example.com"},
-        2: {"name": "Bob", "email": "bob@example.com"},
-        3: {"name": "Charlie", "email": "charlie@example.com"},
-    }
-    user_info = mock_users.get(user_id, {"error": "User not found."})
-    return json.dumps({"user_info": user_info})
+    user_info = MOCK_USERS.get(user_id, {"error": "User not found."})
+    return _dumps({"user_info": user_info})
 
 
 def longest_word_in_sentences(sentences: List[str]) -> str:
@@ -170,20 +192,12 @@ def longest_word_in_sentences(sentences: List[str]) -> str:
     :rtype: str
     """
     if not sentences:
-        return json.dumps({"error": "The list of sentences is empty"})
+        return _dumps({"error": "The list of sentences is empty"})
 
-    longest_words = {}
-    for sentence in sentences:
-        # Split sentence into words
-        words = sentence.split()
-        if words:
-            # Find the longest word
-            longest_word = max(words, key=len)
-            longest_words[sentence] = longest_word
-        else:
-            longest_words[sentence] = ""
+    # Map each sentence to its first longest word, or "" when it has no words
+    longest_words = {sentence: max(sentence.split(), key=len, default="") for sentence in sentences}
 
-    return json.dumps({"longest_words": longest_words})
+    return _dumps({"longest_words": longest_words})
 
 
 def process_records(records: List[Dict[str, int]]) -> str:
@@ -193,12 +207,9 @@ def process_records(records: List[Dict[str, int]]) -> str:
     :param records: A list containing dictionaries that map strings to integers.
     :return: A list of sums of the integer values in each record.
     """
-    sums = []
-    for record in records:
-        # Sum up all the values in each dictionary and append the result to the sums list
-        total = sum(record.values())
-        sums.append(total)
-    return json.dumps({"sums": sums})
+    # Sum up all the values in each dictionary
+    sums = [sum(record.values()) for record in records]
+    return _dumps({"sums": sums})
 
 
 # Example User Input for Each Function
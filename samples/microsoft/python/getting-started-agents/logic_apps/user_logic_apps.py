@@ -1,10 +1,70 @@
 import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Callable
 
+from azure.core.exceptions import HttpResponseError
 from azure.identity import DefaultAzureCredential
 from azure.mgmt.logic import LogicManagementClient
 
+# Connection pool limits for Logic App trigger calls; tune via environment variables
+# when many agent runs invoke Logic Apps concurrently.
+AZ_POOL_CONNECTIONS = int(os.getenv("AZ_POOL_CONNECTIONS", "64"))
+AZ_POOL_MAX = int(os.getenv("AZ_POOL_MAX", "256"))
+
+# Retry connection failures and throttled (429) trigger calls with exponential backoff. A 429 means
+# the trigger rejected the call before running the workflow. Read errors and other statuses (such as
+# 503) are not retried, since the workflow may already have run and sent the email.
+LOGIC_APP_RETRY = Retry(
+    total=5,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429,),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# (connect, read) timeout in seconds for Logic App trigger calls
+LOGIC_APP_TIMEOUT = (3.05, 30)
+
+# Error code Logic Apps returns when a callback URL's SAS signature is no longer valid
+INVALID_SIGNATURE_ERROR_CODE = "DirectApiInvalidAuthorizationSignature"
+
+
+def create_pooled_session() -> requests.Session:
+    """
+    Returns a requests.Session whose HTTPS adapter is sized by AZ_POOL_CONNECTIONS/AZ_POOL_MAX
+    and retries with LOGIC_APP_RETRY. Pass the same session to several AzureLogicAppTool
+    instances to share one connection pool between them.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=AZ_POOL_CONNECTIONS,
+        pool_maxsize=AZ_POOL_MAX,
+        pool_block=False,
+        max_retries=LOGIC_APP_RETRY,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _is_invalid_signature(response: requests.Response) -> bool:
+    """
+    Returns True if the trigger rejected the call because the callback URL's SAS signature is invalid.
+    Other 401/404 responses may come from the workflow's own Response action after it has run.
+    """
+    if response.status_code != 401:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    error = body.get("error") if isinstance(body, dict) else None
+    return isinstance(error, dict) and error.get("code") == INVALID_SIGNATURE_ERROR_CODE
+
 
 class AzureLogicAppTool:
     """
@@ -12,18 +72,41 @@ class AzureLogicAppTool:
     and then invoking them with an appropriate payload.
     """
 
-    def __init__(self, subscription_id: str, resource_group: str, credential=None):
+    def __init__(self, subscription_id: str, resource_group: str, credential=None, session=None):
         if credential is None:
             credential = DefaultAzureCredential()
+        self._owns_session = session is None
+        if session is None:
+            session = create_pooled_session()
         self.subscription_id = subscription_id
         self.resource_group = resource_group
         self.logic_client = LogicManagementClient(credential, subscription_id)
 
+        # Reuse one pooled session so repeated invocations keep their TLS connections alive
+        self.session = session
+
         self.callback_urls: Dict[str, str] = {}
+        self.trigger_names: Dict[str, str] = {}
+
+    def __enter__(self) -> "AzureLogicAppTool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the HTTP session if it was created by this tool. A session passed in by the
+        caller is left open, since it may be shared with other tools.
+        """
+        if self._owns_session:
+            self.session.close()
 
     def register_logic_app(self, logic_app_name: str, trigger_name: str) -> None:
         """
         Retrieves and stores a callback URL for a specific Logic App + trigger.
+        The URL is cached and reused for every invocation; it is only looked up again
+        if the trigger rejects its signature (see invoke_logic_app).
         Raises a ValueError if the callback URL is missing.
         """
         callback = self.logic_client.workflow_triggers.list_callback_url(
@@ -36,6 +119,7 @@ class AzureLogicAppTool:
             raise ValueError(f"No callback URL returned for Logic App '{logic_app_name}'.")
 
         self.callback_urls[logic_app_name] = callback.value
+        self.trigger_names[logic_app_name] = trigger_name
 
     def invoke_logic_app(self, logic_app_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -46,7 +130,18 @@ class AzureLogicAppTool:
             raise ValueError(f"Logic App '{logic_app_name}' has not been registered.")
 
         url = self.callback_urls[logic_app_name]
-        response = requests.post(url=url, json=payload)
+        response = self.session.post(url=url, json=payload, timeout=LOGIC_APP_TIMEOUT)
+
+        # The cached callback URL carries a signature that stops working if the trigger's
+        # access keys are regenerated. The trigger rejects such calls before the workflow
+        # runs, so refresh the URL once from ARM and retry only in that case.
+        if _is_invalid_signature(response):
+            try:
+                self.register_logic_app(logic_app_name, self.trigger_names[logic_app_name])
+            except (HttpResponseError, ValueError) as e:
+                return {"error": f"Error refreshing callback URL for {logic_app_name}: {e}"}
+            url = self.callback_urls[logic_app_name]
+            response = self.session.post(url=url, json=payload, timeout=LOGIC_APP_TIMEOUT)
 
         if response.ok:
             return {"result": f"Successfully invoked {logic_app_name}."}
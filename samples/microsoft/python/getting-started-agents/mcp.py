@@ -39,10 +39,11 @@ with project_client:
 
     run = project_client.agents.runs.create(thread_id=thread.id, agent_id=agent.id)
 
-    # Poll the run as long as run status is queued or in progress
+    # Poll the run as long as run status is queued or in progress, backing off exponentially
+    poll_interval = 0.25
     while run.status in ["queued", "in_progress", "requires_action"]:
-        # Wait for a second
-        time.sleep(1)
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, 2.0)
         run = project_client.agents.runs.get(thread_id=thread.id, run_id=run.id)
         print(f"Run status: {run.status}")
 
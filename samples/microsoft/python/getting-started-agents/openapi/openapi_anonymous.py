@@ -69,7 +69,7 @@ with AIProjectClient(
     # --- Agent Creation ---
     # Create an agent configured with the combined OpenAPI tool definitions
     agent = project_client.agents.create_agent(
-        model=os.environ["MODEL_DEPLOYMENT_NAME"], # Specify the model deployment
+        model=model_deployment_name, # Specify the model deployment
         name="my-agent", # Give the agent a name
         instructions="You are a helpful agent", # Define agent's role
         tools=openapi_tool.definitions, # Provide the list of tool definitions